@@ -1,39 +1,89 @@
 from __future__ import annotations
 
-import subprocess
-from typing import List, Optional, Tuple, Union
+import functools
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
 
-from .model_selector import select_oc_model
 from .output import error_exit
 
+# subprocess and model_selector are imported inside the functions that use
+# them: the common path (short lists, no oc model) never needs either.
 
-def get_available_agents() -> List[str]:
-    """Get list of available agents from vibe-rules directory."""
-    import os
-    from pathlib import Path
-    
-    # Get the directory where this script is located
-    current_dir = Path(__file__).parent
-    agents_dir = current_dir.parent.parent / "vibe-rules" / "rules" / "agents"
-    
-    if not agents_dir.exists():
+AGENTS_DIR = Path(__file__).parent.parent.parent / "vibe-rules" / "rules" / "agents"
+FALLBACK_AGENTS = ("claude", "codex", "amp", "oc")
+EXTRA_AGENTS = ("amp", "oc")
+# Lists this short are picked with a numbered prompt instead of spawning fzf.
+SMALL_LIST_THRESHOLD = 12
+
+
+@functools.lru_cache(maxsize=1)
+def get_available_agents() -> Sequence[str]:
+    """Get the available agents from vibe-rules directory.
+
+    The directory scan runs once per process and the result is a shared,
+    immutable tuple; call ``get_available_agents.cache_clear()`` to force a
+    rescan.
+    """
+    try:
+        with os.scandir(AGENTS_DIR) as entries:
+            agents = {entry.name[:-3] for entry in entries if entry.name.endswith(".md") and not entry.name.startswith(".")}
+    except FileNotFoundError:
         # Fallback to known agents if directory doesn't exist
-        return ["claude", "codex", "amp", "oc"]
-    
-    agents = []
-    for agent_file in agents_dir.glob("*.md"):
-        agents.append(agent_file.stem)
-    
+        return FALLBACK_AGENTS
+
     # Add known agents that might not have .md files
-    for agent in ["amp", "oc"]:
-        if agent not in agents:
-            agents.append(agent)
-    
-    return sorted(agents)
+    agents.update(EXTRA_AGENTS)
+    return tuple(sorted(agents))
+
 
+@functools.lru_cache(maxsize=None)
+def _fzf_path() -> Optional[str]:
+    return shutil.which("fzf")
+
+
+def _small_list_select(options: Sequence[str], prompt: str, multi: bool = False) -> List[str]:
+    """Numbered stdin prompt used instead of fzf for short option lists."""
+    hint = "numbers separated by spaces" if multi else "number"
+    while True:
+        print(f"{prompt}:")
+        for idx, option in enumerate(options, start=1):
+            print(f"  {idx}. {option}")
+        try:
+            choice = input(f"Enter {hint} (blank to cancel): ").strip()
+        except EOFError:
+            return []
+        if not choice:
+            return []
+        tokens = choice.replace(",", " ").split() if multi else [choice]
+        selected: List[str] = []
+        for token in tokens:
+            if token.isdigit() and 0 <= int(token) - 1 < len(options):
+                selected.append(options[int(token) - 1])
+            elif token in options:
+                selected.append(token)
+            else:
+                break
+        else:
+            return selected
+        print(f"Invalid selection '{choice}'. Please try again.")
+
+
+def run_fzf_selection(options: Sequence[str], prompt: str = "Select", multi: bool = False) -> List[str]:
+    """Run fzf to let user select from options.
+
+    When stdin is a terminal, short lists (and terminals without fzf
+    installed) use a numbered prompt, which avoids the fzf process startup
+    entirely. Piped stdin is left alone for the prompt text, so fzf, which
+    reads keys from /dev/tty, is used instead.
+    """
+    if sys.stdin.isatty() and (len(options) <= SMALL_LIST_THRESHOLD or _fzf_path() is None):
+        return _small_list_select(options, prompt, multi)
+
+    import subprocess
 
-def run_fzf_selection(options: List[str], prompt: str = "Select", multi: bool = False) -> List[str]:
-    """Run fzf to let user select from options."""
     try:
         cmd = ["fzf", "--prompt", f"{prompt}: "]
         if multi:
@@ -79,6 +129,8 @@ def select_agents_for_duo() -> Optional[Tuple[str, str, Optional[str], Optional[
         return None
     
     first_agent = selected[0]
+
+    from .model_selector import select_oc_model
     
     # Select model for first agent if it's oc
     first_model = None
@@ -148,6 +200,8 @@ def prompt_agent_selection() -> Optional[Tuple[str, Union[Tuple[str, Optional[st
         # If oc is selected, prompt for model selection
         selected_model = None
         if agent == "oc":
+            from .model_selector import select_oc_model
+
             selected_model = select_oc_model()
             if not selected_model:
                 return None
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
-import os
 import shlex
-import tempfile
-from pathlib import Path
+import shutil
+from typing import Dict
 
+from .env import ENV
 from .output import error_exit
 
+# Agent name -> resolved executable, so PATH is scanned at most once per agent.
+_AGENT_BIN_CACHE: Dict[str, str] = {}
+
+
+def _agent_bin(agent: str) -> str:
+    """Return the executable for ``agent``: its VIBE_<AGENT>_BIN override, else its PATH location."""
+    override = ENV.agent_bins.get(agent)
+    if override:
+        return override
+    path = _AGENT_BIN_CACHE.get(agent)
+    if path is None:
+        path = _AGENT_BIN_CACHE[agent] = shutil.which(agent) or agent
+    return path
+
 
 def get_agent_flags(agent_cmd: str) -> str:
     if agent_cmd == "codex":
@@ -22,48 +36,35 @@ def build_agent_command(
     context: str,
     prompt: str,
     codex_command_name: str | None,
-) -> str:
-    command_name = os.environ.get("VIBE_OC_BIN", "oc") if agent_cmd == "oc" else os.environ.get(f"VIBE_{agent_cmd.upper()}_BIN", agent_cmd)
+) -> list[str]:
+    """Return the agent argv; the message is passed directly as an argument."""
+    command_name = _agent_bin(agent_cmd)
     message = context if not prompt else f"{context}\n\n{prompt}"
-    fd, temp_path = tempfile.mkstemp(prefix="vibe-msg.")
-    os.close(fd)
-    temp = Path(temp_path)
-    temp.write_text(message)
-    quoted_temp = shlex.quote(str(temp))
-    
+
     if agent_cmd == "oc":
         # Use full UI: `oc -p` shows the TUI and conversation
-        command = f"{command_name} -p \"$(cat {quoted_temp})\""
-    else:
-        # claude, codex, amp use flags format
-        command = f"{command_name} {agent_flags} \"$(cat {quoted_temp})\""
-        if agent_cmd == "codex" and codex_command_name:
-            command = f"{command} {shlex.quote(codex_command_name)}"
-    
-    return f"{command} && rm -f {quoted_temp}"
+        return [command_name, "-p", message]
+
+    # claude, codex, amp use flags format
+    command = [command_name, *shlex.split(agent_flags), message]
+    if agent_cmd == "codex" and codex_command_name:
+        command.append(codex_command_name)
+    return command
 
 
-def build_claude_command(context: str, prompt: str) -> str:
+def build_claude_command(context: str, prompt: str) -> list[str]:
     return build_agent_command("claude", get_agent_flags("claude"), context, prompt, None)
 
 
-def build_codex_command(context: str, prompt: str, codex_command_name: str | None) -> str:
+def build_codex_command(context: str, prompt: str, codex_command_name: str | None) -> list[str]:
     return build_agent_command("codex", get_agent_flags("codex"), context, prompt, codex_command_name)
 
 
-def build_oc_command(context: str, prompt: str, model: str | None = None) -> str:
-    command_name = os.environ.get("VIBE_OC_BIN", "oc")
+def build_oc_command(context: str, prompt: str, model: str | None = None) -> list[str]:
+    command_name = _agent_bin("oc")
     message = context if not prompt else f"{context}\n\n{prompt}"
-    fd, temp_path = tempfile.mkstemp(prefix="vibe-msg.")
-    os.close(fd)
-    temp = Path(temp_path)
-    temp.write_text(message)
-    quoted_temp = shlex.quote(str(temp))
-    
+
     # Build oc command with optional model
     if model:
-        command = f"{command_name} --model {shlex.quote(model)} -p \"$(cat {quoted_temp})\""
-    else:
-        command = f"{command_name} -p \"$(cat {quoted_temp})\""
-    
-    return f"{command} && rm -f {quoted_temp}"
+        return [command_name, "--model", model, "-p", message]
+    return [command_name, "-p", message]
@@ -1,85 +1,208 @@
 from __future__ import annotations
 
-import argparse
 import os
 import re
-import textwrap
-from typing import List
+import string
+import sys
+from types import SimpleNamespace
+from typing import Any, Dict, List, NoReturn
 
-from .config import Config, DEFAULT_EDITOR
+from .config import DEFAULT_EDITOR, Config
 from .output import info, warning
 from .prompt import gather_prompt
 
 
-def parse_args(argv: List[str]) -> Config:
-    description = textwrap.dedent(
-        """\
-        Usage: vibe [OPTIONS] [TEXT]
-
-        Options:
-          -s, --session NAME  Use specific session name (default: current directory name)
-          -p, --project PATH  Set project directory
-          -i, --stdin         Read input from standard input
-          -e, --editor        Open editor for composing message
-          -f, --file FILE     Read input from file
-          --no-worktree       Run in current directory without creating a worktree
-          -b, --branch NAME   Manually specify branch/worktree name (skips AI generation)
-          --from BRANCH       Start from specified branch instead of master
-          --from-master       When in worktree, branch from master instead of current branch
-          --list              List all active vibe sessions
-          --codex             Use codex agent instead of claude
-          --duo               Run both claude and codex in a split tmux window
-          --duo-review        Review an existing claude+codex worktree pair
-          --amp               Use amp agent instead of claude
-          --oc                Use oc (opencode) agent instead of claude
-          --command NAME      Codex command name (only meaningful for codex)
-          --review-base NAME  Explicitly choose duo base when reviewing
-          -h, --help          Show this help message
-
-        Examples:
-          vibe "Single line message"           # Uses vibe-<current-dir> session
-          vibe -s myproject "fix bug"          # Uses vibe-myproject session
-          echo "Multi-line text" | vibe -i
-          vibe -e                              # Opens editor
-          vibe -f message.txt                  # Read from file
-          vibe -p /path/to/project "fix bug"   # Run in specific project
-          vibe --from feature-branch "add tests"  # Start from feature-branch
-          vibe --list                          # Show all vibe sessions
-        """
-    )
+DESCRIPTION = """\
+Usage: vibe [OPTIONS] [TEXT]
 
-    parser = argparse.ArgumentParser(
-        prog="vibe",
-        add_help=False,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        description=description,
-    )
+Options:
+  -s, --session NAME  Use specific session name (default: current directory name)
+  -p, --project PATH  Set project directory
+  -i, --stdin         Read input from standard input
+  -e, --editor        Open editor for composing message
+  -f, --file FILE     Read input from file
+  --no-worktree       Run in current directory without creating a worktree
+  -b, --branch NAME   Manually specify branch/worktree name (skips AI generation)
+  --from BRANCH       Start from specified branch instead of master
+  --from-master       When in worktree, branch from master instead of current branch
+  --list              List all active vibe sessions
+  --codex             Use codex agent instead of claude
+  --duo               Run both claude and codex in a split tmux window
+  --duo-review        Review an existing claude+codex worktree pair
+  --amp               Use amp agent instead of claude
+  --oc                Use oc (opencode) agent instead of claude
+  --command NAME      Codex command name (only meaningful for codex)
+  --review-base NAME  Explicitly choose duo base when reviewing
+  -h, --help          Show this help message
+
+Examples:
+  vibe "Single line message"           # Uses vibe-<current-dir> session
+  vibe -s myproject "fix bug"          # Uses vibe-myproject session
+  echo "Multi-line text" | vibe -i
+  vibe -e                              # Opens editor
+  vibe -f message.txt                  # Read from file
+  vibe -p /path/to/project "fix bug"   # Run in specific project
+  vibe --from feature-branch "add tests"  # Start from feature-branch
+  vibe --list                          # Show all vibe sessions
+"""
+
+_CODEX_COMMAND_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Flags that consume the following token (or an inline ``--flag=value``).
+_VALUE_FLAGS = {
+    "-s": "session_name",
+    "--session": "session_name",
+    "-p": "project_path",
+    "--project": "project_path",
+    "-f": "input_file",
+    "--file": "input_file",
+    "-b": "branch_name",
+    "--branch": "branch_name",
+    "--from": "from_branch",
+    "--command": "codex_command_name",
+    "--review-base": "review_base",
+    "--tmux-socket": "tmux_socket",
+}
+
+_BOOL_FLAGS = {
+    "-i": "stdin",
+    "--stdin": "stdin",
+    "-e": "editor_mode",
+    "--editor": "editor_mode",
+    "--no-worktree": "no_worktree",
+    "--from-master": "from_master",
+    "--list": "list",
+    "--codex": "codex",
+    "--duo": "duo",
+    "--duo-review": "duo_review",
+    "--amp": "amp",
+    "--oc": "oc",
+    "-h": "help",
+    "--help": "help",
+}
+
+
+# Long flags in the order argparse registered them, which is the order its
+# "ambiguous option" message lists candidates in.
+_LONG_FLAGS = (
+    "--session",
+    "--project",
+    "--stdin",
+    "--editor",
+    "--file",
+    "--no-worktree",
+    "--branch",
+    "--from",
+    "--from-master",
+    "--list",
+    "--codex",
+    "--duo",
+    "--duo-review",
+    "--amp",
+    "--oc",
+    "--command",
+    "--review-base",
+    "--tmux-socket",
+    "--help",
+)
+
+# "-s/--session"-style names used in error messages, as argparse prints them.
+_FLAG_NAMES: Dict[str, str] = {}
+for _flag, _dest in (*_VALUE_FLAGS.items(), *_BOOL_FLAGS.items()):
+    _FLAG_NAMES[_dest] = f"{_FLAG_NAMES[_dest]}/{_flag}" if _dest in _FLAG_NAMES else _flag
+
+_NEGATIVE_NUMBER_RE = re.compile(r"^-\d+$|^-\d*\.\d+$")
+
+
+def _error(message: str) -> NoReturn:
+    sys.stderr.write(f"usage: vibe [OPTIONS] [TEXT]\nvibe: error: {message}\n")
+    raise SystemExit(2)
 
-    parser.add_argument("-s", "--session", dest="session_name")
-    parser.add_argument("-p", "--project", dest="project_path")
-    parser.add_argument("-i", "--stdin", dest="stdin", action="store_true")
-    parser.add_argument("-e", "--editor", dest="editor_mode", action="store_true")
-    parser.add_argument("-f", "--file", dest="input_file")
-    parser.add_argument("--no-worktree", action="store_true")
-    parser.add_argument("-b", "--branch", dest="branch_name")
-    parser.add_argument("--from", dest="from_branch")
-    parser.add_argument("--from-master", action="store_true")
-    parser.add_argument("--list", action="store_true")
-    parser.add_argument("--codex", action="store_true")
-    parser.add_argument("--duo", action="store_true")
-    parser.add_argument("--duo-review", action="store_true")
-    parser.add_argument("--amp", action="store_true")
-    parser.add_argument("--oc", action="store_true")
-    parser.add_argument("--command", dest="codex_command_name")
-    parser.add_argument("--review-base", dest="review_base")
-    parser.add_argument("--tmux-socket", dest="tmux_socket")
-    parser.add_argument("-h", "--help", action="store_true")
-    parser.add_argument("text", nargs=argparse.REMAINDER)
-
-    args = parser.parse_args(argv)
+
+def _is_positional(token: str) -> bool:
+    return not token.startswith("-") or token == "-" or bool(_NEGATIVE_NUMBER_RE.match(token))
+
+
+def _resolve_long(name: str, token: str) -> str:
+    if name in _VALUE_FLAGS or name in _BOOL_FLAGS:
+        return name
+    matches = [flag for flag in _LONG_FLAGS if flag.startswith(name)]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        _error(f"ambiguous option: {token} could match {', '.join(matches)}")
+    _error(f"unrecognized arguments: {token}")
+
+
+def _parse(argv: List[str]) -> Dict[str, Any]:
+    """Walk ``argv`` once, following the old argparse layout.
+
+    Flags are only recognised before the first positional token; that token
+    and everything after it become the prompt text (argparse ``REMAINDER``).
+    Long flags accept unique prefixes, and unknown flags, missing values or
+    values given to boolean flags exit with status 2 as argparse did.
+    """
+    parsed: Dict[str, Any] = {dest: None for dest in _VALUE_FLAGS.values()}
+    parsed.update({dest: False for dest in _BOOL_FLAGS.values()})
+    parsed["text"] = []
+
+    def take_value(dest: str, idx: int) -> int:
+        if idx >= len(argv) or not _is_positional(argv[idx]):
+            _error(f"argument {_FLAG_NAMES[dest]}: expected one argument")
+        parsed[dest] = argv[idx]
+        return idx + 1
+
+    idx = 0
+    while idx < len(argv):
+        token = argv[idx]
+        idx += 1
+        if _is_positional(token) or token == "--":
+            parsed["text"] = list(argv[idx - 1 :])
+            break
+        if token.startswith("--"):
+            name, has_value, inline = token.partition("=")
+            flag = _resolve_long(name, token)
+            if flag in _VALUE_FLAGS:
+                if has_value:
+                    parsed[_VALUE_FLAGS[flag]] = inline
+                else:
+                    idx = take_value(_VALUE_FLAGS[flag], idx)
+                continue
+            if has_value:
+                _error(f"argument {_FLAG_NAMES[_BOOL_FLAGS[flag]]}: ignored explicit argument '{inline}'")
+            parsed[_BOOL_FLAGS[flag]] = True
+            continue
+
+        if token[:2] not in _VALUE_FLAGS and token[:2] not in _BOOL_FLAGS:
+            _error(f"unrecognized arguments: {token}")
+        # Short flags may be combined (``-ie``); a value flag takes the rest
+        # of the token or, if nothing is left, the next argument.
+        pos = 1
+        while pos < len(token):
+            flag = f"-{token[pos]}"
+            if flag in _VALUE_FLAGS:
+                value = token[pos + 1 :]
+                if pos == 1 and value.startswith("="):
+                    parsed[_VALUE_FLAGS[flag]] = value[1:]
+                elif value:
+                    parsed[_VALUE_FLAGS[flag]] = value
+                else:
+                    idx = take_value(_VALUE_FLAGS[flag], idx)
+                break
+            if flag not in _BOOL_FLAGS:
+                previous = _BOOL_FLAGS[f"-{token[pos - 1]}"]
+                _error(f"argument {_FLAG_NAMES[previous]}: ignored explicit argument '{token[pos:]}'")
+            parsed[_BOOL_FLAGS[flag]] = True
+            pos += 1
+
+    return parsed
+
+
+def parse_args(argv: List[str]) -> Config:
+    args = SimpleNamespace(**_parse(argv))
 
     if args.help:
-        info(description)
+        info(DESCRIPTION)
         raise SystemExit(0)
 
     input_mode = "args"
@@ -133,7 +256,7 @@ def parse_args(argv: List[str]) -> Config:
     if not cfg.codex_command_name and cfg.prompt.startswith("/"):
         parts = cfg.prompt.split(maxsplit=1)
         candidate = parts[0][1:]
-        if re.fullmatch(r"[A-Za-z0-9_-]+", candidate or ""):
+        if candidate and _CODEX_COMMAND_CHARS.issuperset(candidate):
             cfg.codex_command_name = candidate
             cfg.prompt = parts[1].strip() if len(parts) > 1 else ""
 
@@ -1,32 +1,15 @@
 from __future__ import annotations
 
 import os
-import shlex
-import subprocess
 import sys
-import tempfile
 from pathlib import Path
 from typing import List
 
-from .agent_selector import prompt_agent_selection
-from .args import parse_args
-from .config import Config
-from .run import run_duo, run_duo_review, run_single
-from .tmux import (
-    attach_session,
-    configure_tmux,
-    ensure_tmux_available,
-    list_vibe_sessions,
-    new_session,
-    session_exists,
-    switch_client,
-)
-
-
-def get_session_name(custom: str | None) -> str:
+
+def get_session_name(custom: str | None, cwd: Path) -> str:
     if custom:
         return f"vibe-{custom}"
-    return f"vibe-{Path.cwd().name}"
+    return f"vibe-{cwd.name}"
 
 
 def inside_tmux() -> bool:
@@ -38,11 +21,13 @@ def _prepend_flag(args: List[str], flag: str) -> None:
         args.insert(0, flag)
 
 
-def handle_session_only(session_name: str) -> None:
+def handle_session_only(session_name: str, cwd: Path) -> None:
+    from .tmux import new_session, session_exists, switch_client
+
     if session_exists(session_name):
         switch_client(session_name)
     else:
-        new_session(session_name, Path.cwd(), detached=True)
+        new_session(session_name, cwd, detached=True)
         switch_client(session_name)
 
 
@@ -67,16 +52,21 @@ def main(argv: List[str] | None = None) -> None:
 
         handle_review_command(args[1:])
         return
+
+    from .args import parse_args
+
     # Check for help flag before doing anything else
     if "--help" in args or "-h" in args:
         cfg = parse_args(args)
         return
-    
-    ensure_tmux_available()
 
-    # Require vibe to be run inside an existing tmux session
+    from .tmux import configure_tmux, ensure_tmux_available, list_vibe_sessions
+
+    # Require vibe to be run inside an existing tmux session; $TMUX being set
+    # already implies tmux is installed, so only probe PATH outside of it
     if not inside_tmux():
         from .output import error_exit
+        ensure_tmux_available()
         error_exit("Error: vibe must be run inside an existing tmux session. Please run 'tmux' first.")
 
 # Check if any agent-specific flags are provided
@@ -85,6 +75,8 @@ def main(argv: List[str] | None = None) -> None:
     
     # If no agent flags provided, prompt for agent selection
     if not has_agent_flags:
+        from .agent_selector import prompt_agent_selection
+
         selection = prompt_agent_selection()
         if not selection:
             return
@@ -127,12 +119,15 @@ def main(argv: List[str] | None = None) -> None:
         list_vibe_sessions()
         return
 
-    session_name = get_session_name(cfg.session_name)
+    cwd = Path.cwd()
+    session_name = get_session_name(cfg.session_name, cwd)
 
     if not cfg.prompt:
-        handle_session_only(session_name)
+        handle_session_only(session_name, cwd)
         return
 
+    from .run import run_duo, run_duo_review, run_single
+
     if cfg.agent_mode == "dual":
         run_duo(cfg)
     elif cfg.agent_mode == "review":
@@ -9,10 +9,10 @@ DEFAULT_EDITOR = os.environ.get("EDITOR", "helix")
 WORKTREE_BASE = Path("./worktrees")
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     session_name: Optional[str]
-    project_path: Optional[str]
+    project_path: Optional[str | os.PathLike[str]]
     input_mode: str
     input_file: Optional[str]
     no_worktree: bool
@@ -0,0 +1,30 @@
+"""Snapshot of the VIBE_<AGENT>_BIN overrides, taken once at import.
+
+Tests patch ``ENV`` directly. Single variables such as TMUX or EDITOR are
+read with ``os.environ.get`` where they are used.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping
+
+
+@dataclass(frozen=True)
+class Env:
+    # VIBE_<AGENT>_BIN overrides keyed by lowercase agent name
+    agent_bins: Mapping[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_environ(cls, environ: Mapping[str, str] = os.environ) -> Env:
+        bins = {
+            key[len("VIBE_") : -len("_BIN")].lower(): value
+            for key, value in environ.items()
+            if key.startswith("VIBE_") and key.endswith("_BIN") and len(key) > len("VIBE__BIN")
+        }
+        return cls(agent_bins=MappingProxyType(bins))
+
+
+ENV = Env.from_environ()
@@ -1,16 +1,97 @@
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, Optional
 
 from .config import Config
 from .output import error_exit, success, warning
 
 
+@dataclass(frozen=True)
+class _GitState:
+    git_dir: Optional[str]
+    inside_work_tree: bool
+    branch: Optional[str]
+
+
+# Per-directory caches so repeated checks within one invocation reuse git's first answer.
+_GIT_STATE: Dict[str, _GitState] = {}
+_BRANCHES: Dict[str, tuple[list[str], Optional[str]]] = {}
+_PULLED: set[str] = set()
+
+
+def _forget_git_state(cwd: str) -> None:
+    _GIT_STATE.pop(cwd, None)
+    _BRANCHES.pop(cwd, None)
+
+
+_REV_PARSE_CMD = ["git", "rev-parse", "--is-inside-work-tree", "--git-dir", "--abbrev-ref", "HEAD"]
+_FOR_EACH_REF_CMD = ["git", "for-each-ref", "--format=%(HEAD)%(refname:short)", "refs/heads/"]
+
+
+def _parse_git_state(returncode: int, stdout: str) -> _GitState:
+    lines = stdout.splitlines()
+    if len(lines) < 2:
+        return _GitState(git_dir=None, inside_work_tree=False, branch=None)
+    # An unborn HEAD still prints the first two lines but fails overall.
+    branch = lines[2].strip() if returncode == 0 and len(lines) > 2 else None
+    return _GitState(git_dir=lines[1].strip(), inside_work_tree=lines[0].strip() == "true", branch=branch)
+
+
+def _parse_branches(stdout: str) -> tuple[list[str], Optional[str]]:
+    branches: list[str] = []
+    current: Optional[str] = None
+    for line in stdout.splitlines():
+        name = line[1:].strip()
+        if not name:
+            continue
+        branches.append(name)
+        if line.startswith("*"):
+            current = name
+    return branches, current
+
+
+def _probe_git_state() -> None:
+    """Fill both caches for the current directory, running the two git probes side by side."""
+    cwd = os.getcwd()
+    if cwd in _GIT_STATE and cwd in _BRANCHES:
+        return
+    rev_parse = subprocess.Popen(_REV_PARSE_CMD, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    for_each_ref = subprocess.Popen(_FOR_EACH_REF_CMD, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    rev_parse_out, _ = rev_parse.communicate()
+    for_each_ref_out, _ = for_each_ref.communicate()
+    _GIT_STATE.setdefault(cwd, _parse_git_state(rev_parse.returncode, rev_parse_out))
+    # Leave failures uncached so the lazy path reports them.
+    if for_each_ref.returncode == 0:
+        _BRANCHES.setdefault(cwd, _parse_branches(for_each_ref_out))
+
+
+def _git_state(*, force: bool = False) -> _GitState:
+    """Repository facts for the current directory from a single ``git rev-parse``.
+
+    Pass ``force=True`` after mutating the repository to re-probe.
+    """
+    cwd = os.getcwd()
+    state = None if force else _GIT_STATE.get(cwd)
+    if state is not None:
+        return state
+    result = subprocess.run(_REV_PARSE_CMD, capture_output=True, text=True)
+    state = _parse_git_state(result.returncode, result.stdout)
+    _GIT_STATE[cwd] = state
+    return state
+
+
+def _git_dir(*, force: bool = False) -> Optional[str]:
+    return _git_state(force=force).git_dir
+
+
 def ensure_git_repo() -> None:
-    result = subprocess.run(["git", "rev-parse", "--git-dir"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    if result.returncode != 0:
+    _probe_git_state()
+    if _git_dir() is None:
         error_exit("Error: Not in a git repository")
 
 
@@ -18,20 +99,26 @@ def pull_latest_changes(cfg: Config) -> None:
     if cfg.from_branch:
         success("Using --from branch: %s (skipping pull from origin)", cfg.from_branch)
         return
+    cwd = os.getcwd()
+    if cwd in _PULLED:
+        return
     success("Pulling latest changes from origin...")
     result = subprocess.run(["git", "pull", "--rebase"], capture_output=True, text=True)
+    _PULLED.add(cwd)
     if result.returncode != 0:
+        # A rebase that stopped part-way leaves HEAD detached.
+        _forget_git_state(cwd)
         warning(
             "Warning: Could not pull latest changes. This might be due to:\n  - Uncommitted changes\n  - Network issues\n  - Remote repository issues\nContinuing anyway..."
         )
 
 
-def current_branch() -> str:
-    result = subprocess.run(["git", "rev-parse", "--abbrev-ref", "HEAD"], capture_output=True, text=True)
-    if result.returncode != 0:
+def current_branch(*, force: bool = False) -> str:
+    branch = _git_state(force=force).branch
+    if branch is None:
         warning("Error: Could not determine current branch")
         return "detached"
-    return result.stdout.strip()
+    return branch
 
 
 def run_init_script(path: Path) -> None:
@@ -44,16 +131,22 @@ def run_init_script(path: Path) -> None:
         warning("Warning: Initialization script failed, continuing anyway...")
 
 
-def _list_local_branches() -> list[str]:
-    result = subprocess.run(
-        ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/"],
-        capture_output=True,
-        text=True,
-    )
+def _list_branches_with_current(*, force: bool = False) -> tuple[list[str], str | None]:
+    """Local branches plus the checked-out one, from a single ``for-each-ref``."""
+    cwd = os.getcwd()
+    cached = None if force else _BRANCHES.get(cwd)
+    if cached is not None:
+        return cached
+    result = subprocess.run(_FOR_EACH_REF_CMD, capture_output=True, text=True)
     if result.returncode != 0:
         warning("Warning: Unable to list local branches; defaulting to HEAD.")
-        return []
-    branches = [line.strip() for line in result.stdout.splitlines() if line.strip()]
+        return [], None
+    _BRANCHES[cwd] = _parse_branches(result.stdout)
+    return _BRANCHES[cwd]
+
+
+def _list_local_branches() -> list[str]:
+    branches, _ = _list_branches_with_current()
     return branches
 
 
@@ -103,14 +196,10 @@ def determine_source_ref(cfg: Config) -> str:
         success("Base branch: master (--from-master)")
         return "master"
 
-    branches = _list_local_branches()
+    branches, current = _list_branches_with_current()
     if not branches:
         return "HEAD"
 
-    current = current_branch()
-    if current == "detached":
-        current = None
-
     if "master" in branches:
         default_branch = "master"
     elif current and current in branches:
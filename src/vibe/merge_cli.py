@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import os
+import re
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, Optional
@@ -22,7 +26,90 @@ class DuoTarget:
     codex_path: Path
 
 
+@functools.lru_cache(maxsize=None)
+def _git_path() -> str:
+    return shutil.which("git") or "git"
+
+
+def _spawn_git(
+    args: list[str],
+    *,
+    capture: bool = True,
+    text: bool = True,
+    env: Optional[Dict[str, str]] = None,
+) -> subprocess.CompletedProcess:
+    """Run ``git *args`` in a way that lets CPython use posix_spawn instead of fork+exec.
+
+    subprocess only takes the posix_spawn path for an absolute executable
+    with ``close_fds=False`` and no ``cwd``; every call here uses ``-C``.
+    """
+    return subprocess.run([_git_path(), *args], capture_output=capture, text=text, close_fds=False, env=env)
+
+
+class _GitSession:
+    """Read-only rev-parse queries for one worktree, each run at most once per merge.
+
+    git has no batch mode covering these, so rather than keeping a helper
+    process alive this memoizes the answers per path.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._rev_parse: Dict[tuple[str, ...], tuple[bool, list[str]]] = {}
+
+    def rev_parse_lines(self, *args: str) -> tuple[bool, list[str]]:
+        """Whether ``git rev-parse`` succeeded, and the lines it printed before stopping."""
+        if args not in self._rev_parse:
+            result = _spawn_git(["-C", str(self.path), "rev-parse", *args])
+            self._rev_parse[args] = (result.returncode == 0, [line.strip() for line in result.stdout.splitlines()])
+        return self._rev_parse[args]
+
+    def rev_parse(self, *args: str) -> Optional[str]:
+        """Stripped ``git rev-parse`` output, or None if git failed."""
+        ok, lines = self.rev_parse_lines(*args)
+        return "\n".join(lines) if ok else None
+
+
+_SESSIONS: Dict[Path, _GitSession] = {}
+
+
+def _git_session(path: Path) -> _GitSession:
+    session = _SESSIONS.get(path)
+    if session is None:
+        session = _SESSIONS[path] = _GitSession(path)
+    return session
+
+
+# Entry names per worktree parent directory, each read with one scandir.
+_DIR_ENTRIES: Dict[Path, frozenset[str]] = {}
+
+
+def _dir_entry_names(parent: Path) -> frozenset[str]:
+    entries = _DIR_ENTRIES.get(parent)
+    if entries is None:
+        try:
+            with os.scandir(parent) as it:
+                entries = frozenset(entry.name for entry in it)
+        except OSError:
+            entries = frozenset()
+        _DIR_ENTRIES[parent] = entries
+    return entries
+
+
+def _worktree_exists(path: Path) -> bool:
+    """Existence check answered from one listing of the parent (duo pairs share it)."""
+    return path.name in _dir_entry_names(path.parent)
+
+
 def handle_merge_command(argv: Iterable[str]) -> None:
+    try:
+        _merge(argv)
+    finally:
+        _SESSIONS.clear()
+        _DIR_ENTRIES.clear()
+
+
+def _merge(argv: Iterable[str]) -> None:
     parser = argparse.ArgumentParser(
         prog="vibe merge",
         description="Merge a duo worktree branch into a target branch",
@@ -60,7 +147,7 @@ def handle_merge_command(argv: Iterable[str]) -> None:
         help="Proceed even if the target branch is dirty",
     )
 
-    args = parser.parse_args(list(argv))
+    args = parser.parse_args(argv)
 
     targets = _collect_duo_targets()
     if not targets:
@@ -72,10 +159,17 @@ def handle_merge_command(argv: Iterable[str]) -> None:
     keeping_branch, keeping_path = _keeping_branch(target, keep)
     repo_root = target.repo_root
 
-    if not keeping_path.exists():
+    if not _worktree_exists(keeping_path):
         error_exit("Worktree for branch %s no longer exists at %s", keeping_branch, keeping_path)
 
-    if _worktree_dirty(keeping_path) and not args.force:
+    # Both status checks are independent git processes; run them side by side.
+    # Fetching only updates remote refs, so checking repo_root early is safe.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        keeping_check = executor.submit(_worktree_dirty, keeping_path)
+        target_check = executor.submit(_worktree_dirty, repo_root)
+        keeping_dirty, target_dirty = keeping_check.result(), target_check.result()
+
+    if keeping_dirty and not args.force:
         error_exit(
             "Unstaged changes detected in %s. Commit or stash before merging, or re-run with --force.",
             keeping_branch,
@@ -88,7 +182,7 @@ def handle_merge_command(argv: Iterable[str]) -> None:
     if not args.no_fetch:
         _run_git(repo_root, ["fetch", "--all"], check=False)
 
-    if _worktree_dirty(repo_root) and not args.force:
+    if target_dirty and not args.force:
         error_exit(
             "Target branch %s has unstaged changes. Commit or stash before merging, or re-run with --force.",
             target_branch,
@@ -122,10 +216,11 @@ def handle_merge_command(argv: Iterable[str]) -> None:
 
 
 def _collect_duo_targets() -> Dict[str, DuoTarget]:
-    raw = list_duo_targets()
+    main_root, raw = list_duo_targets()
     targets: Dict[str, DuoTarget] = {}
     for base, (claude_branch, claude_path, codex_branch, codex_path) in raw.items():
-        repo_root = _git_repo_root(claude_path) or _git_repo_root(codex_path)
+        # Every pair shares the main worktree; only probe git when it is bare.
+        repo_root = main_root or _git_repo_root(claude_path) or _git_repo_root(codex_path)
         if repo_root is None:
             warning("Skipping pair %s: unable to determine repository root", base)
             continue
@@ -180,79 +275,61 @@ def _keeping_branch(target: DuoTarget, keep: str) -> tuple[str, Path]:
     return target.codex_branch, target.codex_path
 
 
+def _status(path: Path) -> subprocess.CompletedProcess[bytes]:
+    # --no-optional-locks keeps status from refreshing (and re-stamping) the index.
+    # Output stays undecoded: callers only test it for emptiness.
+    return _spawn_git(["--no-optional-locks", "-C", str(path), "status", "--short"], text=False)
+
+
 def _worktree_dirty(path: Path) -> bool:
-    result = subprocess.run(
-        ["git", "-C", str(path), "status", "--short"],
-        capture_output=True,
-        text=True,
-    )
+    result = _status(path)
     if result.returncode != 0:
-        warning("Failed to inspect %s: %s", path, result.stderr.strip())
+        warning("Failed to inspect %s: %s", path, result.stderr.decode("utf-8", "replace").strip())
         return False
     return bool(result.stdout.strip())
 
 
 def _git_toplevel(path: Path) -> Optional[Path]:
-    result = subprocess.run(
-        ["git", "-C", str(path), "rev-parse", "--show-toplevel"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return None
-    return Path(result.stdout.strip())
+    toplevel = _git_session(path).rev_parse("--show-toplevel")
+    return Path(toplevel) if toplevel is not None else None
 
 
 def _detect_current_branch(repo_root: Path) -> Optional[str]:
-    result = subprocess.run(
-        ["git", "-C", str(repo_root), "rev-parse", "--abbrev-ref", "HEAD"],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        return None
-    branch = result.stdout.strip()
+    branch = _git_session(repo_root).rev_parse("--abbrev-ref", "HEAD")
     return branch if branch and branch != "HEAD" else None
 
 
 def _run_git(repo_root: Path, args: Iterable[str], *, check: bool = True) -> int:
-    cmd = ["git", "-C", str(repo_root), *args]
-    result = subprocess.run(cmd)
+    git_args = ["-C", str(repo_root), *args]
+    # The command may move HEAD or touch the worktree; drop remembered answers.
+    _SESSIONS.pop(repo_root, None)
+    result = _spawn_git(git_args, capture=False)
     if check and result.returncode != 0:
-        error_exit("Command failed: %s", " ".join(cmd))
+        error_exit("Command failed: %s", " ".join(["git", *git_args]))
     return result.returncode
 
 
 def _find_related_windows(target: DuoTarget):
-    matches = []
-    for window_id, session, name in list_windows():
-        lower = name.lower()
-        if target.base.lower() in lower:
-            matches.append((window_id, session, name))
-            continue
-        if target.claude_branch.lower() in lower or target.codex_branch.lower() in lower:
-            matches.append((window_id, session, name))
-    return matches
+    needles = (target.base, target.claude_branch, target.codex_branch)
+    pattern = re.compile("|".join(re.escape(needle.lower()) for needle in needles))
+    return [(window_id, session, name) for window_id, session, name in list_windows() if pattern.search(name.lower())]
 
 
 def _git_repo_root(path: Path) -> Optional[Path]:
-    for flag in ("--show-toplevel", "--git-common-dir"):
-        result = subprocess.run(
-            ["git", "-C", str(path), "rev-parse", flag],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            resolved = Path(result.stdout.strip())
-            if flag == "--git-common-dir":
-                if resolved.name == ".git":
-                    return resolved.parent
-                if resolved.name == "worktrees":
-                    git_dir = resolved.parent
-                    if git_dir.name == ".git":
-                        return git_dir.parent
-            else:
-                return resolved
+    # One rev-parse for both flags. --git-common-dir goes first because git
+    # stops at the first failing flag, and --show-toplevel fails outside a
+    # work tree; the common dir has been printed by then.
+    ok, lines = _git_session(path).rev_parse_lines("--git-common-dir", "--show-toplevel")
+    if ok and len(lines) > 1:
+        return Path(lines[1])
+    if lines:
+        resolved = Path(lines[0])
+        if resolved.name == ".git":
+            return resolved.parent
+        if resolved.name == "worktrees":
+            git_dir = resolved.parent
+            if git_dir.name == ".git":
+                return git_dir.parent
     return None
 
 
@@ -263,21 +340,11 @@ def _offer_cleanup(target: DuoTarget) -> None:
     if response not in {"y", "yes"}:
         return
 
-    cleanup_tasks = [
-        ("worktree", target.claude_path),
-        ("worktree", target.codex_path),
-        ("branch", target.claude_branch),
-        ("branch", target.codex_branch),
-        ("prompt", WORKTREE_BASE / f"{target.base}.prompt"),
-    ]
-
-    for kind, value in cleanup_tasks:
-        if kind == "worktree":
-            _remove_worktree(target.repo_root, value)
-        elif kind == "branch":
-            _delete_branch(target.repo_root, value)
-        elif kind == "prompt":
-            _delete_file(value)
+    _remove_worktree(target.repo_root, target.claude_path)
+    _remove_worktree(target.repo_root, target.codex_path)
+    # `git worktree remove` takes one path, but `git branch -D` takes many.
+    _delete_branches(target.repo_root, [target.claude_branch, target.codex_branch])
+    _delete_file(WORKTREE_BASE / f"{target.base}.prompt")
 
     for window_id, _, name in _find_related_windows(target):
         kill_window(window_id, delay=False)
@@ -287,46 +354,35 @@ def _offer_cleanup(target: DuoTarget) -> None:
 
 
 def _remove_worktree(repo_root: Path, path: Path) -> None:
-    if not path.exists():
+    if not _worktree_exists(path):
         return
-    result = subprocess.run(
-        [
-            "git",
-            "-C",
-            str(repo_root),
-            "worktree",
-            "remove",
-            str(path),
-            "--force",
-        ],
-        capture_output=True,
-        text=True,
-    )
+    result = _spawn_git(["-C", str(repo_root), "worktree", "remove", str(path), "--force"])
     if result.returncode != 0:
         warning("Failed to remove worktree %s: %s", path, result.stderr.strip())
     else:
         success("Removed worktree %s", path)
 
 
-def _delete_branch(repo_root: Path, branch: str) -> None:
-    if not branch:
+def _delete_branches(repo_root: Path, branches: list[str]) -> None:
+    branches = [branch for branch in dict.fromkeys(branches) if branch]
+    if not branches:
         return
-    result = subprocess.run(
-        [
-            "git",
-            "-C",
-            str(repo_root),
-            "branch",
-            "-D",
-            branch,
-        ],
-        capture_output=True,
-        text=True,
-    )
+    # LC_ALL=C keeps git's per-branch messages parseable under any locale.
+    result = _spawn_git(["-C", str(repo_root), "branch", "-D", *branches], env={**os.environ, "LC_ALL": "C"})
+    deleted = set(branches)
     if result.returncode != 0:
-        warning("Failed to delete branch %s: %s", branch, result.stderr.strip())
-    else:
-        success("Deleted branch %s", branch)
+        # git deletes what it can and reports each branch on its own line.
+        deleted = {
+            line.split()[2]
+            for line in result.stdout.splitlines()
+            if line.startswith("Deleted branch ") and len(line.split()) > 2
+        }
+    for branch in branches:
+        if branch in deleted:
+            success("Deleted branch %s", branch)
+            continue
+        reason = next((line for line in result.stderr.splitlines() if f"'{branch}'" in line), result.stderr.strip())
+        warning("Failed to delete branch %s: %s", branch, reason)
 
 
 def _delete_file(path: Path) -> None:
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 from pathlib import Path
 from typing import List, Optional
 
+from .agent_selector import run_fzf_selection
 from .output import error_exit
 
+# Usage counts from models.json, loaded on first use and kept in step with saves.
+_USAGE_CACHE: Optional[dict] = None
+
 
 def get_config_path() -> Path:
     """Get path to vibe config directory."""
@@ -28,19 +33,35 @@ def load_model_usage() -> dict:
         return {}
 
 
+def _get_usage() -> dict:
+    global _USAGE_CACHE
+    if _USAGE_CACHE is None:
+        _USAGE_CACHE = load_model_usage()
+    return _USAGE_CACHE
+
+
 def save_model_usage(usage_data: dict) -> None:
     """Save model usage data to config file."""
+    global _USAGE_CACHE
     config_path = get_config_path()
+    tmp_path = config_path.with_name(config_path.name + ".tmp")
     try:
-        with open(config_path, 'w') as f:
+        with open(tmp_path, 'w') as f:
             json.dump(usage_data, f, indent=2)
+        # Replace in one step so a crash never leaves a half-written file.
+        os.replace(tmp_path, config_path)
     except IOError as e:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
         error_exit(f"Failed to save model usage: {e}")
+    _USAGE_CACHE = usage_data
 
 
 def increment_model_usage(model: str) -> None:
     """Increment usage count for a model."""
-    usage_data = load_model_usage()
+    usage_data = _get_usage()
     usage_data[model] = usage_data.get(model, 0) + 1
     save_model_usage(usage_data)
 
@@ -75,7 +96,7 @@ def get_available_models() -> List[str]:
 
 def sort_models_by_usage(models: List[str]) -> List[str]:
     """Sort models by usage frequency, most used first."""
-    usage_data = load_model_usage()
+    usage_data = _get_usage()
     
     def sort_key(model):
         # Sort by usage count (descending), then by model name
@@ -93,9 +114,15 @@ def select_oc_model() -> Optional[str]:
     
     # Sort by usage frequency
     sorted_models = sort_models_by_usage(models)
-    
+
+    # Nothing to choose between: skip the picker.
+    if len(sorted_models) == 1:
+        selected_model = sorted_models[0]
+        increment_model_usage(selected_model)
+        return selected_model
+
     # Add usage count to display
-    usage_data = load_model_usage()
+    usage_data = _get_usage()
     display_models = []
     for model in sorted_models:
         count = usage_data.get(model, 0)
@@ -103,23 +130,13 @@ def select_oc_model() -> Optional[str]:
             display_models.append(f"{model} (used {count} times)")
         else:
             display_models.append(model)
-    
-    try:
-        result = subprocess.run(
-            ["fzf", "--prompt", "Select model: "],
-            input="\n".join(display_models),
-            text=True,
-            capture_output=True,
-        )
-        
-        if result.returncode == 0:
-            selected_display = result.stdout.strip()
-            # Extract model name from display (remove usage count if present)
-            selected_model = selected_display.split(" (used")[0]
-            increment_model_usage(selected_model)
-            return selected_model
-        else:
-            return None
-    except FileNotFoundError:
-        error_exit("Error: fzf not found. Please install fzf to use model selection.")
-        return None
\ No newline at end of file
+
+    # Same TTY rule as agent selection: piped stdin still picks via fzf,
+    # which reads keys from /dev/tty.
+    selected = run_fzf_selection(display_models, "Select model")
+    if not selected:
+        return None
+    # Extract model name from display (remove usage count if present)
+    selected_model = selected[0].split(" (used")[0]
+    increment_model_usage(selected_model)
+    return selected_model
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import subprocess
 import textwrap
 import urllib.error
@@ -9,6 +10,9 @@ import urllib.request
 
 from .output import error_exit, warning
 
+# Runs of anything str.isalnum() rejects (underscore included) collapse to one dash.
+_SANITIZE_RE = re.compile(r"[\W_]+")
+
 
 def fetch_openai_key() -> str | None:
     env_key = os.environ.get("VIBE_OPENAI_KEY")
@@ -45,34 +49,24 @@ def openai_chat(api_key: str, system_prompt: str, user_content: str, *, max_toke
     )
     try:
         with urllib.request.urlopen(req) as response:
-            body = response.read().decode("utf-8")
+            # json.load detects the encoding from the raw bytes itself.
+            parsed = json.load(response)
     except urllib.error.HTTPError as exc:
         error_exit("Error: OpenAI request failed with status %s", exc.code)
     except urllib.error.URLError as exc:
         error_exit("Error: OpenAI request failed (%s)", exc.reason)
+    except json.JSONDecodeError:
+        error_exit("Error: Unexpected response from OpenAI")
 
     try:
-        parsed = json.loads(body)
         return parsed["choices"][0]["message"]["content"].strip()
-    except (KeyError, IndexError, json.JSONDecodeError):
+    except (KeyError, IndexError):
         error_exit("Error: Unexpected response from OpenAI")
 
 
 def sanitize_branch_name(name: str) -> str:
-    lowered = name.strip().lower()
-    lowered = lowered.lstrip("-_ ")
-    cleaned = []
-    previous_dash = False
-    for char in lowered:
-        if char.isalnum():
-            cleaned.append(char)
-            previous_dash = False
-        else:
-            if not previous_dash:
-                cleaned.append("-")
-            previous_dash = True
-    sanitized = "".join(cleaned).strip("-")
-    return sanitized
+    lowered = name.strip().lower().lstrip("-_ ")
+    return _SANITIZE_RE.sub("-", lowered).strip("-")
 
 
 def generate_branch_name(prompt: str) -> str:
@@ -83,17 +77,11 @@ def generate_branch_name(prompt: str) -> str:
         warning("Fix the issue or use --no-worktree to work in current directory")
         raise SystemExit(1)
 
-    essence = openai_chat(
-        api_key,
-        "Extract the main topic and intent from this development request in 5-10 words. Focus on the key feature, component, or goal being worked on.",
-        prompt,
-        max_tokens=30,
-    )
     branch = openai_chat(
         api_key,
         textwrap.dedent(
             """\
-            Generate a concise git branch name (2-4 words, hyphenated, lowercase). Focus on the main feature/component. Examples:
+            Generate a concise git branch name (2-4 words, hyphenated, lowercase) for this development request. Focus on the main feature/component being worked on. Examples:
             - "implement multi-user chats" → group-chats
             - "event-driven architecture refactor" → event-architecture
             - "fix authentication bug" → fix-auth
@@ -103,7 +91,7 @@ def generate_branch_name(prompt: str) -> str:
             Return only the branch name, no quotes or explanations.
             """
         ).strip(),
-        essence,
+        prompt,
         max_tokens=10,
     )
     sanitized = sanitize_branch_name(branch)
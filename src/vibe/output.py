@@ -7,17 +7,22 @@ YELLOW = "\033[1;33m"
 RED = "\033[0;31m"
 NC = "\033[0m"
 
+# Whole-line templates, so each message is a single write.
+_SUCCESS_FMT = GREEN + "%s" + NC + "\n"
+_WARNING_FMT = YELLOW + "%s" + NC + "\n"
+_ERROR_FMT = RED + "%s" + NC + "\n"
+
 
 def success(message: str, *args: object) -> None:
-    print(GREEN + (message % args if args else message) + NC)
+    sys.stdout.write(_SUCCESS_FMT % (message % args if args else message))
 
 
 def warning(message: str, *args: object) -> None:
-    print(YELLOW + (message % args if args else message) + NC, file=sys.stderr)
+    sys.stderr.write(_WARNING_FMT % (message % args if args else message))
 
 
 def error(message: str, *args: object) -> None:
-    print(RED + (message % args if args else message) + NC, file=sys.stderr)
+    sys.stderr.write(_ERROR_FMT % (message % args if args else message))
 
 
 def error_exit(message: str, *args: object, exit_code: int = 1) -> None:
@@ -26,4 +31,4 @@ def error_exit(message: str, *args: object, exit_code: int = 1) -> None:
 
 
 def info(message: str, *args: object) -> None:
-    print(message % args if args else message)
+    sys.stdout.write((message % args if args else message) + "\n")
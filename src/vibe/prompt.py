@@ -10,6 +10,11 @@ from typing import Iterable
 from .config import Config
 from .output import error_exit
 
+# Editors that take the start line as a trailing argument, and those that
+# take it as a path:line:col suffix. Either way the cursor lands on line 4.
+_EDITOR_ARGS = {"vim": ("+4",), "nvim": ("+4",), "nano": ("+4",), "emacs": ("+4",)}
+_EDITOR_COLON = frozenset({"helix", "hx"})
+
 
 def gather_prompt(cfg: Config, remaining: Iterable[str]) -> str:
     if cfg.input_mode == "args":
@@ -27,13 +32,13 @@ def gather_prompt(cfg: Config, remaining: Iterable[str]) -> str:
 
 def open_editor(editor: str) -> str:
     fd, tmp_path = tempfile.mkstemp(prefix="vibe.", text=True)
-    os.close(fd)
     tmp = Path(tmp_path)
     try:
-        tmp.write_text(
-            "# Enter your message below. Lines starting with # will be ignored.\n"
-            "# Save and exit when done.\n\n"
-        )
+        with os.fdopen(fd, "w") as handle:
+            handle.write(
+                "# Enter your message below. Lines starting with # will be ignored.\n"
+                "# Save and exit when done.\n\n"
+            )
         editor_cmd = build_editor_command(editor, tmp)
         try:
             subprocess.run(editor_cmd, check=True)
@@ -41,19 +46,17 @@ def open_editor(editor: str) -> str:
             error_exit("Error: Editor '%s' not found", editor)
         except subprocess.CalledProcessError as exc:
             error_exit("Error: Editor exited with code %s", exc.returncode)
-        lines = [line for line in tmp.read_text().splitlines() if not line.startswith("#")]
-        return "\n".join(lines)
+        data = tmp.read_bytes()
+        # Filter the raw bytes and decode once at the end.
+        return b"\n".join(line for line in data.splitlines() if not line.startswith(b"#")).decode("utf-8")
     finally:
         tmp.unlink(missing_ok=True)
 
 
 def build_editor_command(editor: str, path: Path) -> list[str]:
-    if editor in {"vim", "nvim"}:
-        return [editor, str(path), "+4"]
-    if editor in {"helix", "hx"}:
+    extra = _EDITOR_ARGS.get(editor)
+    if extra is not None:
+        return [editor, str(path), *extra]
+    if editor in _EDITOR_COLON:
         return [editor, f"{path}:4:1"]
-    if editor == "nano":
-        return [editor, str(path), "+4"]
-    if editor == "emacs":
-        return [editor, str(path), "+4"]
     return [editor, str(path)]
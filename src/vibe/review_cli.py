@@ -1,15 +1,38 @@
 from __future__ import annotations
 
 import argparse
+import os
 from pathlib import Path
-from typing import Iterable
+from typing import Sequence
 
 from .config import Config
 from .output import error_exit, info
-from .run import run_duo_review, run_single
 
 
-def handle_review_command(argv: Iterable[str]) -> None:
+# Config fields that are the same for every review run.
+_REVIEW_DEFAULTS = dict(
+    session_name=None,
+    input_mode="args",
+    input_file=None,
+    no_worktree=True,
+    branch_name=None,
+    from_branch=None,
+    from_master=False,
+    list_sessions=False,
+    codex_command_name=None,
+    editor=None,
+    tmux_socket=None,
+)
+
+_PARSER: argparse.ArgumentParser | None = None
+_CWD: Path | None = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the ``vibe review`` parser on first use and reuse it afterwards."""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
     parser = argparse.ArgumentParser(
         prog="vibe review",
         description="Review worktrees created by vibe",
@@ -23,12 +46,13 @@ def handle_review_command(argv: Iterable[str]) -> None:
         "--base",
         help="Specific duo base name to review",
     )
-    parser.add_argument(
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
         "--duo",
         action="store_true",
         help="Run claude+codex review (default if worktree pair detected).",
     )
-    parser.add_argument(
+    mode.add_argument(
         "--single",
         action="store_true",
         help="Run a single-agent review instead of duo",
@@ -43,34 +67,48 @@ def handle_review_command(argv: Iterable[str]) -> None:
         default="Review the completed work, list issues, missing tests, and merge readiness.",
         help="Custom review prompt",
     )
+    _PARSER = parser
+    return parser
+
+
+def _cached_cwd() -> Path:
+    global _CWD
+    if _CWD is None:
+        _CWD = Path.cwd()
+    return _CWD
+
+
+def _project_dir(project: Path | None) -> Path:
+    if project is None:
+        return _cached_cwd()
+    # An absolute path with no "." or ".." parts only needs resolve() for its
+    # symlinks, and os.chdir follows those anyway.
+    raw = str(project)
+    if project.is_absolute() and os.path.normpath(raw) == raw:
+        return project
+    return project.resolve()
+
 
-    args = parser.parse_args(list(argv))
+def handle_review_command(argv: Sequence[str]) -> None:
+    # Materialize once: the same list backs parsing and cfg.raw_args.
+    argv_list = argv if isinstance(argv, list) else list(argv)
+    args = _get_parser().parse_args(argv_list)
 
-    project = args.project.resolve() if args.project else Path.cwd()
+    project = _project_dir(args.project)
+    agent_mode = "single" if args.single else "review"
+    agent_cmd = "codex" if args.codex else "claude"
     cfg = Config(
-        session_name=None,
-        project_path=str(project),
-        input_mode="args",
-        input_file=None,
-        no_worktree=True,
-        branch_name=None,
-        from_branch=None,
-        from_master=False,
-        list_sessions=False,
-        agent_cmd="claude" if not args.codex else "codex",
-        agent_mode="single",
-        codex_command_name=None,
+        **_REVIEW_DEFAULTS,
+        project_path=project,
+        agent_cmd=agent_cmd,
+        agent_mode=agent_mode,
         prompt=args.prompt,
-        raw_args=list(argv),
-        editor=None,
-        tmux_socket=None,
+        raw_args=argv_list,
         review_base=args.base,
     )
 
-    if args.single:
-        run_single(cfg)
-        return
+    # .run pulls in tmux, git and OpenAI helpers; only load it once we dispatch.
+    from .run import run_duo_review, run_single
 
-    cfg.agent_mode = "review"
-    run_duo_review(cfg)
+    (run_single if args.single else run_duo_review)(cfg)
 
@@ -4,19 +4,16 @@ import argparse
 import os
 import sys
 import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Set
+from types import ModuleType
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set
 
-try:
-    import tomllib
-except ModuleNotFoundError:  # pragma: no cover - Python <3.11 fallback
-    try:
-        import tomli as tomllib  # type: ignore[no-redef]
-    except ModuleNotFoundError:  # pragma: no cover
-        tomllib = None
 
-SKIP_DIR_NAMES = {
+SKIP_DIR_NAMES = frozenset({
     ".git",
     ".hg",
     ".svn",
@@ -33,20 +30,30 @@ SKIP_DIR_NAMES = {
     "bazel-bin",
     "bazel-out",
     "bazel-testlogs",
-}
+})
 
 AUTO_START_MARK = "<!-- vibe:auto:start -->"
 AUTO_END_MARK = "<!-- vibe:auto:end -->"
 AUTO_NOTICE = "<!-- Managed by `vibe rules apply`; edits below will be overwritten. -->"
+NO_RULES_NOTICE = "<!-- No rules selected yet. -->"
+
+# Upper bound on how long queued key presses are applied before redrawing.
+KEY_DRAIN_SECONDS = 0.016
+
+_AUTO_HEADER_BYTES = f"{AUTO_START_MARK}\n{AUTO_NOTICE}\n\n".encode("utf-8")
+_AUTO_FOOTER_BYTES = f"\n\n{AUTO_END_MARK}\n".encode("utf-8")
+_NO_RULES_BYTES = NO_RULES_NOTICE.encode("utf-8")
 
-REGISTRY_FILENAMES = {
+RULE_FILENAMES = frozenset({"agents.md", "claude.md"})
+
+REGISTRY_FILENAMES = frozenset({
     "_base.md",
     "_claude.md",
     "_codex.md",
-}
+})
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputTarget:
     key: str
     label: str
@@ -54,7 +61,7 @@ class OutputTarget:
     defaults: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplyConfig:
     registry_root: Path
     project_root: Path
@@ -132,14 +139,30 @@ def handle_rules_command(argv: Sequence[str]) -> None:
     handler(args)
 
 
+def _make_parent_dirs(paths: Iterable[Path]) -> None:
+    """Create each distinct parent directory once, shallowest first."""
+    for parent in sorted({path.parent for path in paths}, key=lambda p: len(p.parts)):
+        parent.mkdir(parents=True, exist_ok=True)
+
+
+@lru_cache(maxsize=None)
+def _tomllib() -> Optional[ModuleType]:
+    try:
+        import tomllib
+    except ModuleNotFoundError:  # pragma: no cover - Python <3.11 fallback
+        try:
+            import tomli as tomllib  # type: ignore[no-redef]
+        except ModuleNotFoundError:  # pragma: no cover
+            return None
+    return tomllib
+
+
 def _default_registry_root() -> Path:
     return (Path.home() / "code" / "vibe-rules")
 
 
 def _bootstrap_command(args: argparse.Namespace) -> None:
     registry_root = args.registry.expanduser().resolve()
-    rules_dir = registry_root / "rules"
-    rules_dir.mkdir(parents=True, exist_ok=True)
 
     templates: Dict[Path, str] = {
         Path("README.md"): textwrap.dedent(
@@ -185,9 +208,9 @@ def _bootstrap_command(args: argparse.Namespace) -> None:
     overwritten_files: List[str] = []
     skipped_files: List[str] = []
 
+    _make_parent_dirs(registry_root / rel_path for rel_path in templates)
     for rel_path, content in templates.items():
         destination = registry_root / rel_path
-        destination.parent.mkdir(parents=True, exist_ok=True)
         if destination.exists() and not args.force:
             skipped_files.append(rel_path.as_posix())
             continue
@@ -276,14 +299,20 @@ def _collect_unique_lines(
     excluded = exclude_root.resolve() if exclude_root else None
     unique_count = 0
 
-    for file_path in _iter_rule_files(source_root):
-        if excluded and _is_relative_to(file_path, excluded):
-            continue
+    paths = [
+        file_path
+        for file_path in _iter_rule_files(source_root)
+        if not (excluded and _is_relative_to(file_path, excluded))
+    ]
+    # Reads overlap in the pool; map() keeps results in walk order so the
+    # dedup below stays deterministic.
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+        texts = list(pool.map(_safe_read, paths))
+
+    for file_path, text in zip(paths, texts):
         rel_path = file_path.relative_to(source_root).as_posix()
         source_files.add(rel_path)
-        try:
-            text = file_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
+        if text is None:
             continue
         new_lines: List[str] = []
         for raw_line in text.splitlines():
@@ -303,27 +332,41 @@ def _collect_unique_lines(
     return blocks, source_files, unique_count
 
 
-def _iter_rule_files(root: Path) -> Sequence[Path]:
-    matches: List[Path] = []
+def _safe_read(file_path: Path) -> Optional[str]:
+    try:
+        return file_path.read_text(encoding="utf-8")
+    except (UnicodeDecodeError, OSError):
+        return None
+
+
+def _iter_rule_files(root: Path) -> Iterator[Path]:
+    # Depth-first over name-sorted entries, so paths come out in the same
+    # order as sorting them afterwards would give. DirEntry answers
+    # is_symlink()/is_dir() from the readdir buffer, so pruning costs no
+    # extra stat per entry.
     if not root.exists():
-        return matches
-    for dirpath, dirnames, filenames in os.walk(root):
-        dirnames[:] = [
-            d
-            for d in dirnames
-            if d not in SKIP_DIR_NAMES
-            and not d.startswith(".")
-            and not Path(dirpath, d).is_symlink()
-        ]
-        for name in filenames:
-            lower = name.lower()
-            if lower in {"agents.md", "claude.md"}:
-                candidate = Path(dirpath) / name
-                if candidate.is_symlink():
-                    continue
-                matches.append(candidate)
-    matches.sort()
-    return matches
+        return
+    stack: List[tuple[bool, str]] = [(True, str(root))]
+    while stack:
+        is_dir, path = stack.pop()
+        if not is_dir:
+            yield Path(path)
+            continue
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        children: List[tuple[bool, str]] = []
+        for entry in entries:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIR_NAMES and not entry.name.startswith("."):
+                    children.append((True, entry.path))
+            elif entry.name.lower() in RULE_FILENAMES:
+                children.append((False, entry.path))
+        stack.extend(reversed(children))
 
 
 def _is_relative_to(path: Path, other: Path) -> bool:
@@ -335,7 +378,7 @@ def _is_relative_to(path: Path, other: Path) -> bool:
 
 
 def _apply_command(args: argparse.Namespace) -> None:
-    if tomllib is None:
+    if _tomllib() is None:
         print(
             "Python 3.11+ is required for `tomllib`. Install the `tomli` package "
             "or upgrade Python to use `vibe rules apply`.",
@@ -424,7 +467,7 @@ def _load_apply_config(config_path: Path) -> ApplyConfig:
 
     if config_path and config_path.exists():
         with config_path.open("rb") as fh:
-            data = tomllib.load(fh)
+            data = _tomllib().load(fh)
 
         project_cfg: Dict[str, object] = data.get("project", {}) if isinstance(data, dict) else {}
 
@@ -480,13 +523,14 @@ def _load_apply_config(config_path: Path) -> ApplyConfig:
 
 def _gather_registry_files(registry_root: Path) -> List[str]:
     rules_dir = registry_root / "rules"
-    if not rules_dir.exists():
+    # One scandir pass: DirEntry.is_file() reuses the type from the listing
+    # instead of a stat per match, and names map straight to "rules/<name>".
+    try:
+        with os.scandir(rules_dir) as entries:
+            paths = [f"rules/{entry.name}" for entry in entries if entry.name.endswith(".md") and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    paths: List[str] = []
-    for path in rules_dir.glob("*.md"):
-        if path.is_file():
-            paths.append(path.relative_to(registry_root).as_posix())
-    paths = sorted(paths)
+    paths.sort()
     return paths
 
 
@@ -515,10 +559,9 @@ def _run_apply_ui(
 ) -> Dict[str, Set[str]]:
     import curses
 
-    rule_contents = {
-        path: (registry_root / path).read_text(encoding="utf-8", errors="ignore")
-        for path in rule_paths
-    }
+    @lru_cache(maxsize=None)
+    def rule_lines(path: str) -> List[str]:
+        return _read_utf8(registry_root / path).splitlines()
 
     tab_keys = {9}
     if hasattr(curses, "KEY_TAB"):
@@ -543,14 +586,113 @@ def _run_apply_ui(
         "[PgUp/PgDn] preview  [w] write  [q] cancel"
     )
 
+    output_labels = [target.label for target in outputs]
+    output_headers = [
+        "Outputs: "
+        + "  ".join(f"[{label}]" if idx == active else label for idx, label in enumerate(output_labels))
+        for active in range(len(output_labels))
+    ]
+
+    @lru_cache(maxsize=None)
+    def header_row(active: int, width: int) -> str:
+        return output_headers[active][:width].ljust(width)
+
+    @lru_cache(maxsize=None)
+    def chrome_rows(width: int) -> tuple[str, str]:
+        return "-" * width, instructions[: width - 1].ljust(width - 1)
+
+    def render_frame(height: int, width: int, left_width: int, list_height: int) -> Dict[int, str]:
+        # Every row is padded to the full width so a changed row overwrites
+        # whatever was drawn there before without clearing the screen.
+        divider, footer = chrome_rows(width)
+        frame: Dict[int, str] = {}
+        frame[0] = header_row(current_output, width)
+        frame[1] = divider
+
+        selected = selection_map[outputs[current_output].key]
+        preview_width = max(0, width - left_width - 2)
+        preview_slice: List[str] = []
+        if rule_paths:
+            content_lines = rule_lines(rule_paths[current_rule])
+            preview_slice = content_lines[preview_scroll : preview_scroll + list_height]
+        else:
+            preview_slice = ["(No rules found)"]
+
+        for offset in range(list_height):
+            index = list_scroll + offset
+            left = ""
+            if index < len(rule_paths):
+                path = rule_paths[index]
+                marker = "[x]" if path in selected else "[ ]"
+                prefix = ">" if index == current_rule else " "
+                left = f"{prefix}{marker} {path[: left_width - 6]}"
+            right = preview_slice[offset] if offset < len(preview_slice) else ""
+            frame[2 + offset] = (
+                left[:left_width].ljust(left_width)
+                + "| "
+                + right[:preview_width].ljust(preview_width)
+            )[:width]
+
+        frame[height - 2] = divider
+        frame[height - 1] = footer
+        return frame
+
+    def handle_key(ch: int, list_height: int) -> bool:
+        nonlocal current_rule, current_output, preview_scroll
+        selected = selection_map[outputs[current_output].key]
+        if ch in (ord("q"), 27):
+            raise _UserAbort
+        if ch in (curses.KEY_UP, ord("k")):
+            if current_rule > 0:
+                current_rule -= 1
+                preview_scroll = 0
+        elif ch in (curses.KEY_DOWN, ord("j")):
+            if current_rule < len(rule_paths) - 1:
+                current_rule += 1
+                preview_scroll = 0
+        elif ch == curses.KEY_PPAGE:
+            preview_scroll = max(0, preview_scroll - max(1, list_height // 2))
+        elif ch == curses.KEY_NPAGE:
+            max_preview_scroll = 0
+            if rule_paths:
+                max_preview_scroll = max(0, len(rule_lines(rule_paths[current_rule])) - list_height)
+            preview_scroll = min(preview_scroll + max(1, list_height // 2), max_preview_scroll)
+        elif ch in tab_keys:
+            current_output = (current_output + 1) % len(outputs)
+            preview_scroll = 0
+        elif ch in back_tab_keys:
+            current_output = (current_output - 1) % len(outputs)
+            preview_scroll = 0
+        elif ch in (ord(" "), ord("x"), ord("X"), curses.KEY_ENTER, 10, 13):
+            if rule_paths:
+                active_path = rule_paths[current_rule]
+                if active_path in selected:
+                    selected.remove(active_path)
+                else:
+                    selected.add(active_path)
+        elif ch in (ord("a"), ord("A")):
+            selected.update(rule_paths)
+        elif ch in (ord("n"), ord("N")):
+            selected.clear()
+        elif ch in (ord("w"), ord("s")):
+            return True
+        return False
+
     def draw(stdscr: "curses._CursesWindow") -> Dict[str, Set[str]]:  # type: ignore[name-defined]
         nonlocal current_rule, current_output, list_scroll, preview_scroll
         curses.curs_set(0)
         stdscr.keypad(True)
+        stdscr.leaveok(True)
+
+        last_frame: Dict[int, str] = {}
+        frame_size = (0, 0)
 
         while True:
-            stdscr.clear()
             height, width = stdscr.getmaxyx()
+            if (height, width) != frame_size:
+                frame_size = (height, width)
+                last_frame = {}
+                stdscr.clear()
             if height < 8 or width < 40:
                 stdscr.addstr(0, 0, "Resize terminal (min 8x40) to continue.")
                 stdscr.refresh()
@@ -566,101 +708,37 @@ def _run_apply_ui(
             max_rule_index = max(0, len(rule_paths) - 1)
             current_rule = clamp(current_rule, 0, max_rule_index)
 
-            active_output = outputs[current_output]
-            selected = selection_map[active_output.key]
-
             if current_rule < list_scroll:
                 list_scroll = current_rule
             elif current_rule >= list_scroll + list_height:
                 list_scroll = current_rule - list_height + 1
 
-            stdscr.addstr(
-                0,
-                0,
-                "Outputs: "
-                + "  ".join(
-                    f"[{target.label}]" if idx == current_output else target.label
-                    for idx, target in enumerate(outputs)
-                ),
-            )
-
-            stdscr.hline(1, 0, ord("-"), width)
-
-            visible_rules = rule_paths[list_scroll : list_scroll + list_height]
-            for offset, path in enumerate(visible_rules):
-                row = 2 + offset
-                marker = "[x]" if path in selected else "[ ]"
-                prefix = ">" if (list_scroll + offset) == current_rule else " "
-                truncated = path[: left_width - 6]
-                stdscr.addstr(row, 0, f"{prefix}{marker} {truncated}")
-
-            stdscr.vline(2, left_width, ord("|"), list_height)
-
             if rule_paths:
-                active_path = rule_paths[current_rule]
-                content_lines = rule_contents.get(active_path, "").splitlines()
-                max_preview_scroll = max(0, len(content_lines) - list_height)
+                max_preview_scroll = max(0, len(rule_lines(rule_paths[current_rule])) - list_height)
                 preview_scroll = clamp(preview_scroll, 0, max_preview_scroll)
-                preview_slice = content_lines[
-                    preview_scroll : preview_scroll + list_height
-                ]
-                for offset, line in enumerate(preview_slice):
-                    row = 2 + offset
-                    trimmed = line[: max(0, width - left_width - 2)]
-                    stdscr.addstr(row, left_width + 2, trimmed)
-            else:
-                stdscr.addstr(2, left_width + 2, "(No rules found)")
 
-            stdscr.hline(height - 2, 0, ord("-"), width)
-            stdscr.addstr(height - 1, 0, instructions[: width - 1])
-            stdscr.refresh()
+            frame = render_frame(height, width, left_width, list_height)
+            for row, text in frame.items():
+                if last_frame.get(row) != text:
+                    stdscr.addstr(row, 0, text)
+            last_frame = frame
+            stdscr.noutrefresh()
+            curses.doupdate()
 
+            # Apply keys queued behind this one (e.g. a held-down j) before
+            # drawing again, redrawing at least every KEY_DRAIN_SECONDS.
             ch = stdscr.getch()
-            if ch in (ord("q"), 27):
-                raise _UserAbort
-            if ch in (curses.KEY_UP, ord("k")):
-                if current_rule > 0:
-                    current_rule -= 1
-                    preview_scroll = 0
-                continue
-            if ch in (curses.KEY_DOWN, ord("j")):
-                if current_rule < len(rule_paths) - 1:
-                    current_rule += 1
-                    preview_scroll = 0
-                continue
-            if ch == curses.KEY_PPAGE:
-                preview_scroll = max(0, preview_scroll - max(1, list_height // 2))
-                continue
-            if ch == curses.KEY_NPAGE:
-                preview_scroll = min(
-                    preview_scroll + max(1, list_height // 2),
-                    max(0, len(rule_contents.get(rule_paths[current_rule], "").splitlines()) - list_height),
-                )
-                continue
-            if ch in tab_keys:
-                current_output = (current_output + 1) % len(outputs)
-                preview_scroll = 0
-                continue
-            if ch in back_tab_keys:
-                current_output = (current_output - 1) % len(outputs)
-                preview_scroll = 0
-                continue
-            if ch in (ord(" "), ord("x"), ord("X"), curses.KEY_ENTER, 10, 13):
-                if rule_paths:
-                    active_path = rule_paths[current_rule]
-                    if active_path in selected:
-                        selected.remove(active_path)
-                    else:
-                        selected.add(active_path)
-                continue
-            if ch in (ord("a"), ord("A")):
-                selected.update(rule_paths)
-                continue
-            if ch in (ord("n"), ord("N")):
-                selected.clear()
-                continue
-            if ch in (ord("w"), ord("s")):
-                return {key: set(paths) for key, paths in selection_map.items()}
+            deadline = time.monotonic() + KEY_DRAIN_SECONDS
+            stdscr.nodelay(True)
+            try:
+                while ch != -1:
+                    if handle_key(ch, list_height):
+                        return {key: set(paths) for key, paths in selection_map.items()}
+                    if time.monotonic() >= deadline:
+                        break
+                    ch = stdscr.getch()
+            finally:
+                stdscr.nodelay(False)
 
     return curses.wrapper(draw)
 
@@ -674,39 +752,66 @@ def _write_selected_rules(
     rule_paths: List[str],
 ) -> None:
     ordered_lookup = {path: idx for idx, path in enumerate(rule_paths)}
-    for target in outputs:
+    destinations = [(project_root / target.relative_path).resolve() for target in outputs]
+    _make_parent_dirs(destinations)
+
+    contents: Dict[str, str] = {}
+    for path in set().union(*(selections.get(target.key, set()) for target in outputs)):
+        file_path = registry_root / path
+        if file_path.exists():
+            contents[path] = _read_utf8(file_path).strip()
+
+    for target, destination in zip(outputs, destinations):
         selected_paths = selections.get(target.key, set())
-        ordered = sorted(selected_paths, key=lambda path: ordered_lookup.get(path, 0))
-        sections: List[str] = []
-        for path in ordered:
-            file_path = registry_root / path
-            if not file_path.exists():
-                continue
-            sections.append(file_path.read_text(encoding="utf-8", errors="ignore").strip())
+        ordered = sorted((ordered_lookup.get(path, 0), path) for path in selected_paths)
+        sections = [contents[path] for _, path in ordered if path in contents]
         generated = _render_generated_rules(sections)
 
-        destination = (project_root / target.relative_path).resolve()
-        destination.parent.mkdir(parents=True, exist_ok=True)
 
-        manual_prefix = _read_manual_prefix(destination, target.label)
+        try:
+            existing: Optional[bytes] = _read_bytes(destination)
+        except FileNotFoundError:
+            existing = None
+        manual_prefix = _manual_prefix(
+            None if existing is None else _decode_text(existing), target.label
+        )
         manual_block = manual_prefix.rstrip("\n")
 
-        parts: List[str] = []
-        if manual_block:
-            parts.append(manual_block)
-            parts.append("")
-        parts.extend([AUTO_START_MARK, AUTO_NOTICE])
-        if generated:
-            parts.extend(["", generated])
-        else:
-            parts.extend(["", "<!-- No rules selected yet. -->"])
-        parts.extend(["", AUTO_END_MARK, ""])
-        output_text = "\n".join(parts)
-        destination.write_text(output_text, encoding="utf-8")
+        output_bytes = b"".join(
+            (
+                manual_block.encode("utf-8") + b"\n\n" if manual_block else b"",
+                _AUTO_HEADER_BYTES,
+                generated.encode("utf-8") if generated else _NO_RULES_BYTES,
+                _AUTO_FOOTER_BYTES,
+            )
+        )
+        if output_bytes != existing:
+            destination.write_bytes(output_bytes)
+
+
+def _read_bytes(file_path: Path) -> bytes:
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        chunks: List[bytes] = []
+        while chunk := os.read(fd, 1 << 17):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode like read_text(errors="ignore"), including universal newlines."""
+    text = data.decode("utf-8", errors="ignore")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _read_utf8(file_path: Path) -> str:
+    return _decode_text(_read_bytes(file_path))
 
 
-def _read_manual_prefix(file_path: Path, label: str) -> str:
-    if not file_path.exists():
+def _manual_prefix(existing: Optional[str], label: str) -> str:
+    if existing is None:
         template = [
             f"# {label} Notes",
             "",
@@ -714,11 +819,10 @@ def _read_manual_prefix(file_path: Path, label: str) -> str:
         ]
         return "\n".join(template)
 
-    text = file_path.read_text(encoding="utf-8", errors="ignore")
-    if AUTO_START_MARK in text:
-        prefix = text.split(AUTO_START_MARK)[0]
+    if AUTO_START_MARK in existing:
+        prefix = existing.split(AUTO_START_MARK)[0]
         return prefix.rstrip("\n")
-    return text.rstrip("\n")
+    return existing.rstrip("\n")
 
 
 def _render_generated_rules(sections: List[str]) -> str:
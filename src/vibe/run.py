@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import shlex
+import tempfile
 import time
 from pathlib import Path
 
@@ -26,7 +28,7 @@ from .worktree import (
 )
 
 
-def build_command_for_agent(agent: str, context: str, prompt: str, codex_command_name: str | None = None, model: str | None = None) -> str:
+def build_command_for_agent(agent: str, context: str, prompt: str, codex_command_name: str | None = None, model: str | None = None) -> list[str]:
     """Build the appropriate command for any agent."""
     if agent == "claude":
         return build_claude_command(context, prompt)
@@ -40,6 +42,43 @@ def build_command_for_agent(agent: str, context: str, prompt: str, codex_command
         return build_agent_command(agent, agent_flags, context, prompt, codex_command_name)
 
 
+# tmux refuses send-keys commands longer than about 16 KB ("command too
+# long"), so lines above this size hand their long arguments off via files.
+SEND_KEYS_LIMIT = 8192
+_INLINE_ARG_LIMIT = 256
+
+
+def _command_line(command: list[str]) -> str:
+    """Shell-quote ``command`` for typing into a pane's interactive shell.
+
+    Readline acts on control characters as they are typed (a tab completes,
+    a newline ends the line), so arguments containing any, as well as
+    arguments of an oversized line, are handed off through temp files.
+    """
+    line = shlex.join(command)
+    if len(line.encode("utf-8")) <= SEND_KEYS_LIMIT and all(arg.isprintable() for arg in command):
+        return line
+
+    parts: list[str] = []
+    temp_paths: list[str] = []
+    for arg in command:
+        if arg.isprintable() and len(arg) <= _INLINE_ARG_LIMIT:
+            parts.append(shlex.quote(arg))
+            continue
+        fd, temp_path = tempfile.mkstemp(prefix="vibe-msg.")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(arg)
+        quoted_temp = shlex.quote(temp_path)
+        temp_paths.append(quoted_temp)
+        parts.append(f'"$(cat {quoted_temp})"')
+    return f"{' '.join(parts)} && rm -f {' '.join(temp_paths)}"
+
+
+def _send_command(target: str, command: list[str]) -> None:
+    """Type ``command`` into a tmux pane as one shell line and run it."""
+    send_keys(target, _command_line(command), "C-m")
+
+
 def run_single(cfg: Config) -> None:
     if cfg.project_path:
         project = Path(cfg.project_path)
@@ -83,7 +122,7 @@ def run_no_worktree(cfg: Config) -> None:
     else:
         agent_flags = get_agent_flags(cfg.agent_cmd)
         command = build_agent_command(cfg.agent_cmd, agent_flags, context, cfg.prompt, cfg.codex_command_name)
-    send_keys(window_id, command, "C-m")
+    _send_command(window_id, command)
 
     success("\u2713 Successfully started %s in current directory in window: %s", cfg.agent_cmd, window_id)
 
@@ -128,7 +167,7 @@ def run_with_worktree(cfg: Config) -> None:
     else:
         agent_flags = get_agent_flags(cfg.agent_cmd)
         command = build_agent_command(cfg.agent_cmd, agent_flags, context, cfg.prompt, cfg.codex_command_name)
-    send_keys(window_id, command, "C-m")
+    _send_command(window_id, command)
 
     success("\u2713 Successfully created worktree and started %s in window: %s", cfg.agent_cmd, window_id)
 
@@ -188,8 +227,8 @@ def run_duo_no_worktree(cfg: Config) -> None:
     agent1_cmd = build_command_for_agent(agent1, agent1_context, cfg.prompt, cfg.codex_command_name, model1)
     agent2_cmd = build_command_for_agent(agent2, agent2_context, cfg.prompt, cfg.codex_command_name, model2)
 
-    send_keys(left_pane, agent1_cmd, "C-m")
-    send_keys(right_pane, agent2_cmd, "C-m")
+    _send_command(left_pane, agent1_cmd)
+    _send_command(right_pane, agent2_cmd)
 
     success("\u2713 Started %s (left) and %s (right) in window: %s", agent1, agent2, window_id)
 
@@ -247,8 +286,8 @@ def run_duo_with_worktrees(cfg: Config) -> None:
     agent1_cmd = build_command_for_agent(agent1, agent1_context, cfg.prompt, cfg.codex_command_name, model1)
     agent2_cmd = build_command_for_agent(agent2, agent2_context, cfg.prompt, cfg.codex_command_name, model2)
 
-    send_keys(left_pane, agent1_cmd, "C-m")
-    send_keys(right_pane, agent2_cmd, "C-m")
+    _send_command(left_pane, agent1_cmd)
+    _send_command(right_pane, agent2_cmd)
 
     success(
         "\u2713 Started %s (left) on %s and %s (right) on %s in window: %s",
@@ -321,8 +360,8 @@ def run_duo_review(cfg: Config) -> None:
     claude_cmd = build_claude_command(claude_context, review_prompt)
     codex_cmd = build_codex_command(codex_context, review_prompt, cfg.codex_command_name)
 
-    send_keys(left_pane, claude_cmd, "C-m")
-    send_keys(right_pane, codex_cmd, "C-m")
+    _send_command(left_pane, claude_cmd)
+    _send_command(right_pane, codex_cmd)
 
     success(
         "\u2713 Started review for base '%s' (claude left, codex right) in window: %s",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import shutil
 import subprocess
 import time
@@ -21,8 +22,14 @@ def configure_tmux(socket: str | None) -> None:
         TMUX_SOCKET_ARGS = []
 
 
+@functools.lru_cache(maxsize=None)
+def _tmux_path() -> Optional[str]:
+    """``shutil.which("tmux")``, looked up once per process."""
+    return shutil.which("tmux")
+
+
 def ensure_tmux_available() -> None:
-    if shutil.which("tmux") is None:
+    if _tmux_path() is None:
         error_exit("Error: tmux not found. Please install tmux to use vibe.")
 
 
@@ -102,7 +109,6 @@ def split_window(window_id: str, *, direction: str = "-h", cwd: Path) -> str:
     return pane_id
 
 
-
 def set_window_dir(window_id: str, path: Path) -> None:
     result = subprocess.run(["tmux", "setw", "-t", window_id, "@window_dir", str(path)])
     if result.returncode != 0:
@@ -128,7 +134,7 @@ def current_pane(window_id: str) -> str:
 
 
 def list_windows() -> List[Tuple[str, str, str]]:
-    if shutil.which("tmux") is None:
+    if _tmux_path() is None:
         return []
     try:
         output = run_tmux(["list-windows", "-a", "-F", "#{window_id} #{session_name} #{window_name}"], capture=True)
@@ -145,7 +151,7 @@ def list_windows() -> List[Tuple[str, str, str]]:
 
 
 def kill_window(window_id: str, *, delay: bool = False) -> None:
-    if shutil.which("tmux") is None:
+    if _tmux_path() is None:
         return
     if delay:
         def _delayed_kill(window: str) -> None:
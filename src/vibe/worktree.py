@@ -120,26 +120,36 @@ def prepare_agent_worktree(agent_label: str, branch_name: str, source_ref: str)
     return worktree_path
 
 
-def list_worktree_branches() -> Dict[str, Path]:
+def list_worktree_branches() -> Tuple[Optional[Path], Dict[str, Path]]:
+    """Return the main worktree (None for a bare repository) and the worktree of each branch."""
     result = subprocess.run(
         ["git", "worktree", "list", "--porcelain"],
         capture_output=True,
         text=True,
         check=True,
     )
+    # git always lists the main worktree first.
+    main_path: Optional[Path] = None
+    seen_first = False
     branches: Dict[str, Path] = {}
     current_path: Optional[Path] = None
     for line in result.stdout.splitlines():
         if line.startswith("worktree "):
             current_path = Path(line.split(maxsplit=1)[1])
+            if not seen_first:
+                main_path = current_path
+                seen_first = True
+        elif line == "bare" and current_path == main_path:
+            main_path = None
         elif line.startswith("branch ") and current_path is not None:
             branch = line.split(maxsplit=1)[1].replace("refs/heads/", "")
             branches[branch] = current_path
-    return branches
+    return main_path, branches
 
 
-def list_duo_targets() -> Dict[str, Tuple[str, Path, str, Path]]:
-    branches = list_worktree_branches()
+def list_duo_targets() -> Tuple[Optional[Path], Dict[str, Tuple[str, Path, str, Path]]]:
+    """Return the repository root alongside the claude/codex worktree pairs keyed by base."""
+    repo_root, branches = list_worktree_branches()
     pairs: Dict[str, Tuple[str, Path, str, Path]] = {}
     claude_map: Dict[str, Path] = {}
     codex_map: Dict[str, Path] = {}
@@ -162,11 +172,11 @@ def list_duo_targets() -> Dict[str, Tuple[str, Path, str, Path]]:
                 codex_path,
             )
 
-    return pairs
+    return repo_root, pairs
 
 
 def resolve_review_target(base_hint: Optional[str]) -> Tuple[str, Path, str, Path, str]:
-    targets = list_duo_targets()
+    _, targets = list_duo_targets()
     if base_hint:
         match = targets.get(base_hint)
         if not match:
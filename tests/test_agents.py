@@ -1,22 +1,41 @@
 from __future__ import annotations
 
-import os
-from pathlib import Path
+import pytest
 
-from vibe.agents import build_oc_command
+from vibe.agents import build_codex_command, build_oc_command
+from vibe.env import Env
 
 
-def test_build_oc_command_places_model_before_prompt(monkeypatch, tmp_path):
-    temp_file = tmp_path / "msg.txt"
+@pytest.fixture(autouse=True)
+def bare_agent_bins(monkeypatch):
+    monkeypatch.setattr("vibe.agents.ENV", Env.from_environ({}))
+    monkeypatch.setattr("vibe.agents._AGENT_BIN_CACHE", {})
+    monkeypatch.setattr("vibe.agents.shutil.which", lambda name: None)
 
-    def fake_mkstemp(prefix):
-        fd = os.open(temp_file, os.O_CREAT | os.O_RDWR)
-        return fd, str(temp_file)
-
-    monkeypatch.setattr("vibe.agents.tempfile.mkstemp", fake_mkstemp)
 
+def test_build_oc_command_places_model_before_prompt():
     command = build_oc_command("ctx", "prompt", "test-model")
 
-    assert "--model test-model -p \"$(cat " in command
-    assert "&& rm -f {}".format(temp_file) in command
-    assert temp_file.read_text() == "ctx\n\nprompt"
+    assert command == ["oc", "--model", "test-model", "-p", "ctx\n\nprompt"]
+
+
+def test_build_codex_command_appends_command_name():
+    command = build_codex_command("ctx", "", "pr")
+
+    assert command == ["codex", "--dangerously-bypass-approvals-and-sandbox", "ctx", "pr"]
+
+
+def test_agent_binary_is_resolved_once(monkeypatch):
+    lookups: list[str] = []
+
+    def fake_which(name):
+        lookups.append(name)
+        return f"/opt/bin/{name}"
+
+    monkeypatch.setattr("vibe.agents.shutil.which", fake_which)
+
+    build_codex_command("ctx", "", None)
+    command = build_codex_command("ctx", "", None)
+
+    assert command[0] == "/opt/bin/codex"
+    assert lookups == ["codex"]
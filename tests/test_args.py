@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import pytest
+
+from vibe.args import _parse, parse_args
+
+
+def test_parse_args_value_and_boolean_flags():
+    cfg = parse_args(["-s", "proj", "--from=dev", "--codex", "--no-worktree", "fix", "the", "bug"])
+
+    assert cfg.session_name == "proj"
+    assert cfg.from_branch == "dev"
+    assert cfg.agent_cmd == "codex"
+    assert cfg.no_worktree is True
+    assert cfg.prompt == "fix the bug"
+
+
+def test_parse_args_flags_after_text_belong_to_prompt():
+    cfg = parse_args(["describe", "-s", "--duo"])
+
+    assert cfg.session_name is None
+    assert cfg.agent_mode == "single"
+    assert cfg.prompt == "describe -s --duo"
+
+
+def test_parse_args_extracts_codex_command_name():
+    cfg = parse_args(["--codex", "/pr", "open it"])
+
+    assert cfg.codex_command_name == "pr"
+    assert cfg.prompt == "open it"
+
+
+def test_parse_args_missing_value_exits():
+    with pytest.raises(SystemExit):
+        parse_args(["--branch"])
+
+
+@pytest.mark.parametrize(
+    ("argv", "message"),
+    [
+        (["--bogus", "x"], "unrecognized arguments: --bogus"),
+        (["-x", "y"], "unrecognized arguments: -x"),
+        (["--help=1"], "argument -h/--help: ignored explicit argument '1'"),
+        (["-ix", "t"], "argument -i/--stdin: ignored explicit argument 'x'"),
+        (["--co", "t"], "ambiguous option: --co could match --codex, --command"),
+        (["--branch"], "argument -b/--branch: expected one argument"),
+        (["-s", "--duo"], "argument -s/--session: expected one argument"),
+    ],
+)
+def test_parse_args_rejects_bad_flags_like_argparse(argv, message, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        parse_args(argv)
+
+    assert excinfo.value.code == 2
+    err = capsys.readouterr().err
+    assert err.startswith("usage: vibe")
+    assert err.rstrip().endswith(f"vibe: error: {message}")
+
+
+def test_parse_args_expands_unique_long_prefixes():
+    cfg = parse_args(["--no-work", "--cod", "--sess", "proj", "go"])
+
+    assert cfg.no_worktree is True
+    assert cfg.agent_cmd == "codex"
+    assert cfg.session_name == "proj"
+    assert cfg.prompt == "go"
+
+
+def test_parse_args_combined_short_flags_take_trailing_value():
+    parsed = _parse(["-is", "proj", "-b=feat", "go"])
+
+    assert parsed["stdin"] is True
+    assert parsed["session_name"] == "proj"
+    assert parsed["branch_name"] == "feat"
+    assert parsed["text"] == ["go"]
+
+
+def test_parse_args_reads_tmux_socket_at_call_time(monkeypatch):
+    monkeypatch.setenv("VIBE_TMUX_SOCKET", "late-socket")
+
+    assert parse_args(["go"]).tmux_socket == "late-socket"
+    assert parse_args(["--tmux-socket", "explicit", "go"]).tmux_socket == "explicit"
@@ -11,16 +11,16 @@ def cli_test_env(monkeypatch: pytest.MonkeyPatch):
 
     calls: list[SimpleNamespace] = []
 
-    monkeypatch.setattr(cli, "ensure_tmux_available", lambda: None)
+    monkeypatch.setattr("vibe.tmux.ensure_tmux_available", lambda: None)
     monkeypatch.setattr(cli, "inside_tmux", lambda: True)
-    monkeypatch.setattr(cli, "configure_tmux", lambda _: None)
-    monkeypatch.setattr(cli, "run_duo", lambda cfg: (_ for _ in ()).throw(RuntimeError("run_duo should not be called")))
-    monkeypatch.setattr(cli, "run_duo_review", lambda cfg: (_ for _ in ()).throw(RuntimeError("run_duo_review should not be called")))
+    monkeypatch.setattr("vibe.tmux.configure_tmux", lambda _: None)
+    monkeypatch.setattr("vibe.run.run_duo", lambda cfg: (_ for _ in ()).throw(RuntimeError("run_duo should not be called")))
+    monkeypatch.setattr("vibe.run.run_duo_review", lambda cfg: (_ for _ in ()).throw(RuntimeError("run_duo_review should not be called")))
 
     def fake_run_single(cfg):
         calls.append(SimpleNamespace(cfg=cfg))
 
-    monkeypatch.setattr(cli, "run_single", fake_run_single)
+    monkeypatch.setattr("vibe.run.run_single", fake_run_single)
     return calls
 
 
@@ -30,7 +30,7 @@ def test_single_selection_uses_oc_agent(monkeypatch: pytest.MonkeyPatch, cli_tes
     def fake_prompt_selection():
         return "single", ("oc", "gpt-test-model")
 
-    monkeypatch.setattr(cli, "prompt_agent_selection", fake_prompt_selection)
+    monkeypatch.setattr("vibe.agent_selector.prompt_agent_selection", fake_prompt_selection)
 
     cli.main(["inspect the repo"])
 
@@ -38,3 +38,41 @@ def test_single_selection_uses_oc_agent(monkeypatch: pytest.MonkeyPatch, cli_tes
     cfg = cli_test_env[0].cfg
     assert cfg.agent_cmd == "oc"
     assert cfg.selected_model == "gpt-test-model"
+
+
+def test_piped_stdin_is_not_read_for_short_lists(monkeypatch: pytest.MonkeyPatch):
+    import io
+    import subprocess
+
+    import vibe.agent_selector as selector
+
+    stdin = io.StringIO("fix the login bug\n")
+    monkeypatch.setattr("sys.stdin", stdin)
+    fzf_calls: list[list[str]] = []
+
+    def fake_run(cmd, **kwargs):
+        fzf_calls.append(cmd)
+        return SimpleNamespace(returncode=0, stdout="duo\n")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+
+    assert selector.run_fzf_selection(["single", "duo"], "Select mode") == ["duo"]
+    assert fzf_calls and fzf_calls[0][0] == "fzf"
+    assert stdin.read() == "fix the login bug\n"
+
+
+def test_piped_stdin_still_asks_for_the_model(monkeypatch: pytest.MonkeyPatch):
+    import io
+    import subprocess
+
+    import vibe.model_selector as model_selector
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("fix the login bug\n"))
+    monkeypatch.setattr(model_selector, "get_available_models", lambda: ["openai/a", "openai/b"])
+    monkeypatch.setattr(model_selector, "_get_usage", lambda: {})
+    monkeypatch.setattr(model_selector, "increment_model_usage", lambda model: None)
+    monkeypatch.setattr(
+        subprocess, "run", lambda cmd, **kwargs: SimpleNamespace(returncode=0, stdout="openai/b\n")
+    )
+
+    assert model_selector.select_oc_model() == "openai/b"
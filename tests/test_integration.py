@@ -64,7 +64,7 @@ def _worktree_paths(repo: Path) -> list[str]:
 
 
 def test_duo_worktree_launches_agents(cli_environment, git_repo):
-    cli_environment.openai.queue(["phase one", "phase-one"])
+    cli_environment.openai.queue(["phase-one"])
 
     run_cli(["--duo", "implement phase"], env=cli_environment.env, cwd=git_repo)
 
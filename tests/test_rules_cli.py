@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from vibe.rules_cli import OutputTarget, _write_selected_rules
+
+
+def _write(tmp_path: Path, selected: set[str]) -> Path:
+    registry = tmp_path / "registry"
+    (registry / "rules").mkdir(parents=True, exist_ok=True)
+    (registry / "rules" / "_base.md").write_text("# Base\r\n\r\nbase rule\r\n")
+    (registry / "rules" / "_codex.md").write_text("\n# Codex\ncodex rule\n\n")
+
+    _write_selected_rules(
+        registry_root=registry,
+        project_root=tmp_path,
+        outputs=[OutputTarget("agents", "AGENTS", Path("AGENTS.md"), [])],
+        selections={"agents": selected},
+        rule_paths=["rules/_base.md", "rules/_codex.md"],
+    )
+    return tmp_path / "AGENTS.md"
+
+
+def test_write_selected_rules_keeps_manual_prefix(tmp_path):
+    destination = tmp_path / "AGENTS.md"
+    destination.write_text("# Mine\n\nkeep me\n\n<!-- vibe:auto:start -->\nold\n<!-- vibe:auto:end -->\n")
+
+    _write(tmp_path, {"rules/_codex.md", "rules/_base.md"})
+
+    assert destination.read_bytes() == (
+        b"# Mine\n\nkeep me\n\n"
+        b"<!-- vibe:auto:start -->\n"
+        b"<!-- Managed by `vibe rules apply`; edits below will be overwritten. -->\n\n"
+        b"# Base\n\nbase rule\n\n# Codex\ncodex rule\n\n"
+        b"<!-- vibe:auto:end -->\n"
+    )
+
+
+def test_write_selected_rules_without_selection(tmp_path):
+    destination = _write(tmp_path, set())
+
+    assert destination.read_text() == (
+        "# AGENTS Notes\n\n"
+        "<!-- Everything above this marker is maintained manually. -->\n\n"
+        "<!-- vibe:auto:start -->\n"
+        "<!-- Managed by `vibe rules apply`; edits below will be overwritten. -->\n\n"
+        "<!-- No rules selected yet. -->\n\n"
+        "<!-- vibe:auto:end -->\n"
+    )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import subprocess
+
+from vibe.run import SEND_KEYS_LIMIT, _command_line
+
+
+def test_short_command_line_is_inline():
+    assert _command_line(["claude", "--flag", "fix it"]) == "claude --flag 'fix it'"
+
+
+def test_long_message_is_handed_off_through_a_file(tmp_path, monkeypatch):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    message = "line with 'quotes' and $dollars\n" * 5000
+
+    line = _command_line(["printf", "%s", message])
+
+    assert len(line.encode("utf-8")) < SEND_KEYS_LIMIT
+    result = subprocess.run(["sh", "-c", line], capture_output=True, text=True, check=True)
+    # $(cat ...) drops trailing newlines, as the original handoff did.
+    assert result.stdout == message.rstrip("\n")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_tabs_and_newlines_are_not_typed_into_the_shell(tmp_path, monkeypatch):
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    message = "implement\tphase\nsecond line"
+
+    line = _command_line(["printf", "%s", message])
+
+    assert line.isprintable()
+    result = subprocess.run(["sh", "-c", line], capture_output=True, text=True, check=True)
+    assert result.stdout == message
+    assert list(tmp_path.iterdir()) == []